@@ -70,7 +70,7 @@ class EthMacFrame:
     def from_payload(cls, payload, min_len=60, tx_complete=None):
         payload = bytearray(payload)
         if len(payload) < min_len:
-            payload.extend(bytearray(min_len-len(payload)))
+            payload.extend(bytes(min_len-len(payload)))
         payload.extend(struct.pack('<L', zlib.crc32(payload)))
         return cls(payload, tx_complete=tx_complete)
 
@@ -88,7 +88,7 @@ class EthMacFrame:
         return self.data[-4:]
 
     def check_fcs(self):
-        return self.get_fcs() == struct.pack('<L', zlib.crc32(self.get_payload(strip_fcs=True)))
+        return int.from_bytes(self.get_fcs(), 'little') == zlib.crc32(self.get_payload(strip_fcs=True))
 
     def handle_tx_complete(self):
         if isinstance(self.tx_complete, Event):
@@ -23,6 +23,7 @@ THE SOFTWARE.
 """
 
 import logging
+import operator
 import struct
 import zlib
 
@@ -36,6 +37,51 @@ from .constants import EthPre, ETH_PREAMBLE
 from .reset import Reset
 
 
+_NIBBLE_LO = bytes(b & 0x0F for b in range(256))
+_NIBBLE_HI = bytes(b >> 4 for b in range(256))
+_NIBBLE_LO_SHL = bytes((b & 0x0F) << 4 for b in range(256))
+
+# lookup table to detect SFD, in both GMII and MII
+_IS_SFD = bytes(b in (EthPre.SFD, 0xD) for b in range(256))
+
+
+def _gmii_to_mii(data, error):
+    # split bytes into MII nibbles, low nibble first
+    n = len(data)
+    d = bytearray(n*2)
+    d[0::2] = data.translate(_NIBBLE_LO)
+    d[1::2] = data.translate(_NIBBLE_HI)
+    e = bytearray(n*2)
+    e[0::2] = e[1::2] = error
+    return d, e
+
+
+def _pack_nibbles(data, error):
+    # combine pairs of nibbles into bytes, low nibble first
+    n = len(data) & ~1
+    d = bytes(map(operator.or_, data[0:n:2], data[1:n:2].translate(_NIBBLE_LO_SHL)))
+    e = bytes(map(operator.or_, error[0:n:2], error[1:n:2]))
+    return d, e
+
+
+def _mii_to_gmii(data, error):
+    # reassemble MII nibbles into bytes, realigning on the SFD
+    data = bytes(data).translate(_NIBBLE_LO)
+    error = bytes(error)
+
+    # offset of the high nibble of the SFD
+    sfd = data.find(b'\x05\x0d') + 1
+
+    if sfd and not sfd & 1:
+        # SFD straddles a pair boundary; realign
+        d1, e1 = _pack_nibbles(data[:sfd], error[:sfd])
+        d2, e2 = _pack_nibbles(data[sfd+1:], error[sfd+1:])
+        return bytearray(d1 + bytes([EthPre.SFD]) + d2), bytearray(e1 + error[sfd:sfd+1] + e2)
+
+    d, e = _pack_nibbles(data, error)
+    return bytearray(d), bytearray(e)
+
+
 class GmiiFrame:
     def __init__(self, data=None, error=None, tx_complete=None):
         self.data = bytearray()
@@ -47,14 +93,16 @@ class GmiiFrame:
 
         if type(data) is GmiiFrame:
             self.data = bytearray(data.data)
-            self.error = data.error
+            if data.error is not None:
+                self.error = bytearray(data.error)
             self.sim_time_start = data.sim_time_start
             self.sim_time_sfd = data.sim_time_sfd
             self.sim_time_end = data.sim_time_end
             self.tx_complete = data.tx_complete
         else:
             self.data = bytearray(data)
-            self.error = error
+            if error is not None:
+                self.error = bytearray(error)
 
         if tx_complete is not None:
             self.tx_complete = tx_complete
@@ -63,7 +111,7 @@ class GmiiFrame:
     def from_payload(cls, payload, min_len=60, tx_complete=None):
         payload = bytearray(payload)
         if len(payload) < min_len:
-            payload.extend(bytearray(min_len-len(payload)))
+            payload.extend(bytes(min_len-len(payload)))
         payload.extend(struct.pack('<L', zlib.crc32(payload)))
         return cls.from_raw_payload(payload, tx_complete=tx_complete)
 
@@ -89,18 +137,20 @@ class GmiiFrame:
         return self.data[-4:]
 
     def check_fcs(self):
-        return self.get_fcs() == struct.pack('<L', zlib.crc32(self.get_payload(strip_fcs=True)))
+        return int.from_bytes(self.get_fcs(), 'little') == zlib.crc32(self.get_payload(strip_fcs=True))
 
     def normalize(self):
         n = len(self.data)
 
         if self.error is not None:
-            self.error = self.error[:n] + [self.error[-1]]*(n-len(self.error))
+            self.error = bytearray(self.error[:n])
+            if len(self.error) < n:
+                self.error.extend(bytearray([self.error[-1]])*(n-len(self.error)))
         else:
-            self.error = [0]*n
+            self.error = bytearray(n)
 
     def compact(self):
-        if self.error is not None and not any(self.error):
+        if self.error is not None and self.error.count(0) == len(self.error):
             self.error = None
 
     def handle_tx_complete(self):
@@ -264,21 +314,27 @@ class GmiiSource(Reset):
     async def _run(self):
         frame = None
         frame_offset = 0
+        frame_len = 0
         frame_data = None
         frame_error = None
         ifg_cnt = 0
         self.active = False
 
+        data = self.data
+        er = self.er
+        dv = self.dv
+        enable = self.enable
+
         clock_edge_event = RisingEdge(self.clock)
 
         enable_event = None
-        if self.enable is not None:
-            enable_event = RisingEdge(self.enable)
+        if enable is not None:
+            enable_event = RisingEdge(enable)
 
         while True:
             await clock_edge_event
 
-            if self.enable is None or self.enable.value:
+            if enable is None or enable.value:
                 if ifg_cnt > 0:
                     # in IFG
                     ifg_cnt -= 1
@@ -301,41 +357,36 @@ class GmiiSource(Reset):
 
                     if self.mii_mode:
                         # convert to MII
-                        frame_data = []
-                        frame_error = []
-                        for b, e in zip(frame.data, frame.error):
-                            frame_data.append(b & 0x0F)
-                            frame_data.append(b >> 4)
-                            frame_error.append(e)
-                            frame_error.append(e)
+                        frame_data, frame_error = _gmii_to_mii(frame.data, frame.error)
                     else:
                         frame_data = frame.data
                         frame_error = frame.error
 
                     self.active = True
                     frame_offset = 0
+                    frame_len = len(frame_data)
 
                 if frame is not None:
                     d = frame_data[frame_offset]
-                    if frame.sim_time_sfd is None and d in (EthPre.SFD, 0xD):
+                    if frame.sim_time_sfd is None and _IS_SFD[d]:
                         frame.sim_time_sfd = get_sim_time()
-                    self.data.value = d
-                    if self.er is not None:
-                        self.er.value = frame_error[frame_offset]
-                    self.dv.value = 1
+                    data.value = d
+                    if er is not None:
+                        er.value = frame_error[frame_offset]
+                    dv.value = 1
                     frame_offset += 1
 
-                    if frame_offset >= len(frame_data):
+                    if frame_offset >= frame_len:
                         ifg_cnt = max(self.ifg, 1)
                         frame.sim_time_end = get_sim_time()
                         frame.handle_tx_complete()
                         frame = None
                         self.current_frame = None
                 else:
-                    self.data.value = 0
-                    if self.er is not None:
-                        self.er.value = 0
-                    self.dv.value = 0
+                    data.value = 0
+                    if er is not None:
+                        er.value = 0
+                    dv.value = 0
                     self.active = False
 
                     if ifg_cnt == 0 and self.queue.empty():
@@ -343,7 +394,7 @@ class GmiiSource(Reset):
                         self.active_event.clear()
                         await self.active_event.wait()
 
-            elif self.enable is not None and not self.enable.value:
+            else:
                 await enable_event
 
 
@@ -446,26 +497,31 @@ class GmiiSink(Reset):
         frame = None
         self.active = False
 
+        data = self.data
+        er = self.er
+        dv = self.dv
+        enable = self.enable
+
         clock_edge_event = RisingEdge(self.clock)
 
-        active_event = RisingEdge(self.dv)
+        active_event = RisingEdge(dv)
 
         enable_event = None
-        if self.enable is not None:
-            enable_event = RisingEdge(self.enable)
+        if enable is not None:
+            enable_event = RisingEdge(enable)
 
         while True:
             await clock_edge_event
 
-            if self.enable is None or self.enable.value:
-                d_val = self.data.value.integer
-                dv_val = self.dv.value.integer
-                er_val = 0 if self.er is None else self.er.value.integer
+            if enable is None or enable.value:
+                d_val = data.value.integer
+                dv_val = dv.value.integer
+                er_val = 0 if er is None else er.value.integer
 
                 if frame is None:
                     if dv_val:
                         # start of frame
-                        frame = GmiiFrame(bytearray(), [])
+                        frame = GmiiFrame(bytearray(), bytearray())
                         frame.sim_time_start = get_sim_time()
                 else:
                     if not dv_val:
@@ -475,25 +531,7 @@ class GmiiSink(Reset):
                             self.mii_mode = bool(self.mii_select.value.integer)
 
                         if self.mii_mode:
-                            odd = True
-                            sync = False
-                            b = 0
-                            be = 0
-                            data = bytearray()
-                            error = []
-                            for n, e in zip(frame.data, frame.error):
-                                odd = not odd
-                                b = (n & 0x0F) << 4 | b >> 4
-                                be |= e
-                                if not sync and b == EthPre.SFD:
-                                    odd = True
-                                    sync = True
-                                if odd:
-                                    data.append(b)
-                                    error.append(be)
-                                    be = 0
-                            frame.data = data
-                            frame.error = error
+                            frame.data, frame.error = _mii_to_gmii(frame.data, frame.error)
 
                         frame.compact()
                         frame.sim_time_end = get_sim_time()
@@ -508,7 +546,7 @@ class GmiiSink(Reset):
                         frame = None
 
                 if frame is not None:
-                    if frame.sim_time_sfd is None and d_val in (EthPre.SFD, 0xD):
+                    if frame.sim_time_sfd is None and _IS_SFD[d_val]:
                         frame.sim_time_sfd = get_sim_time()
 
                     frame.data.append(d_val)
@@ -517,7 +555,7 @@ class GmiiSink(Reset):
                 if not dv_val:
                     await active_event
 
-            elif self.enable is not None and not self.enable.value:
+            else:
                 await enable_event
 
 
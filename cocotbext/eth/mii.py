@@ -30,8 +30,7 @@ from cocotb.triggers import RisingEdge, Timer, First, Event
 from cocotb.utils import get_sim_time, get_sim_steps
 
 from .version import __version__
-from .gmii import GmiiFrame
-from .constants import EthPre
+from .gmii import GmiiFrame, _gmii_to_mii, _mii_to_gmii
 from .reset import Reset
 
 
@@ -165,21 +164,27 @@ class MiiSource(Reset):
     async def _run(self):
         frame = None
         frame_offset = 0
+        frame_len = 0
         frame_data = None
         frame_error = None
         ifg_cnt = 0
         self.active = False
 
+        data = self.data
+        er = self.er
+        dv = self.dv
+        enable = self.enable
+
         clock_edge_event = RisingEdge(self.clock)
 
         enable_event = None
-        if self.enable is not None:
-            enable_event = RisingEdge(self.enable)
+        if enable is not None:
+            enable_event = RisingEdge(enable)
 
         while True:
             await clock_edge_event
 
-            if self.enable is None or self.enable.value:
+            if enable is None or enable.value:
                 if ifg_cnt > 0:
                     # in IFG
                     ifg_cnt -= 1
@@ -198,38 +203,33 @@ class MiiSource(Reset):
                     frame.normalize()
 
                     # convert to MII
-                    frame_data = []
-                    frame_error = []
-                    for b, e in zip(frame.data, frame.error):
-                        frame_data.append(b & 0x0F)
-                        frame_data.append(b >> 4)
-                        frame_error.append(e)
-                        frame_error.append(e)
+                    frame_data, frame_error = _gmii_to_mii(frame.data, frame.error)
 
                     self.active = True
                     frame_offset = 0
+                    frame_len = len(frame_data)
 
                 if frame is not None:
                     d = frame_data[frame_offset]
                     if frame.sim_time_sfd is None and d == 0xD:
                         frame.sim_time_sfd = get_sim_time()
-                    self.data.value = d
-                    if self.er is not None:
-                        self.er.value = frame_error[frame_offset]
-                    self.dv.value = 1
+                    data.value = d
+                    if er is not None:
+                        er.value = frame_error[frame_offset]
+                    dv.value = 1
                     frame_offset += 1
 
-                    if frame_offset >= len(frame_data):
+                    if frame_offset >= frame_len:
                         ifg_cnt = max(self.ifg, 1)
                         frame.sim_time_end = get_sim_time()
                         frame.handle_tx_complete()
                         frame = None
                         self.current_frame = None
                 else:
-                    self.data.value = 0
-                    if self.er is not None:
-                        self.er.value = 0
-                    self.dv.value = 0
+                    data.value = 0
+                    if er is not None:
+                        er.value = 0
+                    dv.value = 0
                     self.active = False
 
                     if ifg_cnt == 0 and self.queue.empty():
@@ -237,7 +237,7 @@ class MiiSource(Reset):
                         self.active_event.clear()
                         await self.active_event.wait()
 
-            elif self.enable is not None and not self.enable.value:
+            else:
                 await enable_event
 
 
@@ -337,49 +337,36 @@ class MiiSink(Reset):
         frame = None
         self.active = False
 
+        data = self.data
+        er = self.er
+        dv = self.dv
+        enable = self.enable
+
         clock_edge_event = RisingEdge(self.clock)
 
-        active_event = RisingEdge(self.dv)
+        active_event = RisingEdge(dv)
 
         enable_event = None
-        if self.enable is not None:
-            enable_event = RisingEdge(self.enable)
+        if enable is not None:
+            enable_event = RisingEdge(enable)
 
         while True:
             await clock_edge_event
 
-            if self.enable is None or self.enable.value:
-                d_val = self.data.value.integer
-                dv_val = self.dv.value.integer
-                er_val = 0 if self.er is None else self.er.value.integer
+            if enable is None or enable.value:
+                d_val = data.value.integer
+                dv_val = dv.value.integer
+                er_val = 0 if er is None else er.value.integer
 
                 if frame is None:
                     if dv_val:
                         # start of frame
-                        frame = GmiiFrame(bytearray(), [])
+                        frame = GmiiFrame(bytearray(), bytearray())
                         frame.sim_time_start = get_sim_time()
                 else:
                     if not dv_val:
                         # end of frame
-                        odd = True
-                        sync = False
-                        b = 0
-                        be = 0
-                        data = bytearray()
-                        error = []
-                        for n, e in zip(frame.data, frame.error):
-                            odd = not odd
-                            b = (n & 0x0F) << 4 | b >> 4
-                            be |= e
-                            if not sync and b == EthPre.SFD:
-                                odd = True
-                                sync = True
-                            if odd:
-                                data.append(b)
-                                error.append(be)
-                                be = 0
-                        frame.data = data
-                        frame.error = error
+                        frame.data, frame.error = _mii_to_gmii(frame.data, frame.error)
 
                         frame.compact()
                         frame.sim_time_end = get_sim_time()
@@ -403,7 +390,7 @@ class MiiSink(Reset):
                 if not dv_val:
                     await active_event
 
-            elif self.enable is not None and not self.enable.value:
+            else:
                 await enable_event
 
 
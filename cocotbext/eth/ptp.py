@@ -104,9 +104,8 @@ class PtpClock(Reset):
 
     def set_period_ns(self, t):
         t = Decimal(t)
-        period, drift = self.ctx.divmod(Decimal(t) * Decimal(2**32), Decimal(1))
-        period = int(period)
-        frac = Fraction(drift).limit_denominator(2**16-1)
+        period, drift = divmod(Fraction(t) * 2**32, 1)
+        frac = drift.limit_denominator(2**16-1)
         self.set_period(period >> 32, period & 0xffffffff)
         self.set_drift(frac.numerator, frac.denominator)
 
@@ -234,11 +233,18 @@ class PtpClock(Reset):
             if self.pps is not None:
                 self.pps.value = 0
 
-            # increment tod bit timestamp
-            self.ts_tod_fns += (self.period_ns << 32) + self.period_fns
+            # compute increment, including drift
+            inc = (self.period_ns << 32) + self.period_fns
+
+            if self.drift_denom:
+                if self.drift_cnt > 0:
+                    self.drift_cnt -= 1
+                else:
+                    inc += self.drift_num
+                    self.drift_cnt = self.drift_denom-1
 
-            if self.drift_denom and self.drift_cnt == 0:
-                self.ts_tod_fns += self.drift_num
+            # increment tod bit timestamp
+            self.ts_tod_fns += inc
 
             ns_inc = self.ts_tod_fns >> 32
             self.ts_tod_fns &= 0xffffffff
@@ -255,10 +261,7 @@ class PtpClock(Reset):
                 self.ts_tod.value = (self.ts_tod_s << 48) | (self.ts_tod_ns << 16) | (self.ts_tod_fns >> 16)
 
             # increment rel bit timestamp
-            self.ts_rel_fns += (self.period_ns << 32) + self.period_fns
-
-            if self.drift_denom and self.drift_cnt == 0:
-                self.ts_rel_fns += self.drift_num
+            self.ts_rel_fns += inc
 
             ns_inc = self.ts_rel_fns >> 32
             self.ts_rel_fns &= 0xffffffff
@@ -268,12 +271,6 @@ class PtpClock(Reset):
             if self.ts_rel is not None:
                 self.ts_rel.value = (self.ts_rel_ns << 16) | (self.ts_rel_fns >> 16)
 
-            if self.drift_denom:
-                if self.drift_cnt > 0:
-                    self.drift_cnt -= 1
-                else:
-                    self.drift_cnt = self.drift_denom-1
-
 
 class PtpClockSimTime:
 
@@ -55,12 +55,15 @@ class Reset:
         pass
 
     async def _run_reset(self, reset_signal, active_level):
+        reset_rising_edge_event = RisingEdge(reset_signal)
+        reset_falling_edge_event = FallingEdge(reset_signal)
+
         while True:
             if bool(reset_signal.value):
-                await FallingEdge(reset_signal)
+                await reset_falling_edge_event
                 self._ext_reset = not active_level
                 self._update_reset()
             else:
-                await RisingEdge(reset_signal)
+                await reset_rising_edge_event
                 self._ext_reset = active_level
                 self._update_reset()
@@ -25,16 +25,25 @@ THE SOFTWARE.
 import logging
 
 import cocotb
+from cocotb.clock import Clock
 from cocotb.queue import Queue, QueueFull
 from cocotb.triggers import RisingEdge, FallingEdge, Timer, First, Event
-from cocotb.utils import get_sim_time, get_sim_steps
+from cocotb.utils import get_sim_time
 
 from .version import __version__
-from .gmii import GmiiFrame
+from .gmii import GmiiFrame, _NIBBLE_LO, _NIBBLE_HI, _gmii_to_mii, _mii_to_gmii
 from .constants import EthPre
 from .reset import Reset
 
 
+# lookup table to compute TX_CTL during the second half of the cycle
+# (TX_EN xor TX_ER) for DDR transfer
+_CTRL_ER = bytes(b ^ 1 for b in range(256))
+
+# lookup table to detect SFD, in both RGMII and MII
+_IS_SFD = bytes(b in (EthPre.SFD, 0xD, 0xDD) for b in range(256))
+
+
 class RgmiiSource(Reset):
 
     def __init__(self, data, ctrl, clock, reset=None, enable=None, mii_select=None,
@@ -163,36 +172,41 @@ class RgmiiSource(Reset):
     async def _run(self):
         frame = None
         frame_offset = 0
-        frame_data = None
-        frame_error = None
+        frame_len = 0
+        frame_iter = None
         ifg_cnt = 0
         in_ifg = False
         self.active = False
-        d = 0
-        er = 0
+        d_lo = 0
+        d_hi = 0
         en = 0
+        ctrl_hi = 0
+
+        data = self.data
+        ctrl = self.ctrl
+        enable = self.enable
 
         clock_rising_edge_event = RisingEdge(self.clock)
         clock_falling_edge_event = FallingEdge(self.clock)
 
         enable_event = None
-        if self.enable is not None:
-            enable_event = RisingEdge(self.enable)
+        if enable is not None:
+            enable_event = RisingEdge(enable)
 
         while True:
             await clock_falling_edge_event
 
             # send low nibble after falling edge, leading in to rising edge
-            self.data.value = d & 0x0F
-            self.ctrl.value = en
+            data.value = d_lo
+            ctrl.value = en
 
             await clock_rising_edge_event
 
             # send high nibble after rising edge, leading in to falling edge
-            self.data.value = d >> 4
-            self.ctrl.value = en ^ er
+            data.value = d_hi
+            ctrl.value = ctrl_hi
 
-            if self.enable is None or self.enable.value:
+            if enable is None or enable.value:
                 in_ifg = False
 
                 if ifg_cnt > 0:
@@ -217,41 +231,45 @@ class RgmiiSource(Reset):
                         self.mii_mode = bool(self.mii_select.value.integer)
 
                     if self.mii_mode:
-                        # convert to MII
-                        frame_data = []
-                        frame_error = []
-                        for b, e in zip(frame.data, frame.error):
-                            frame_data.append((b & 0x0F)*0x11)
-                            frame_data.append((b >> 4)*0x11)
-                            frame_error.append(e)
-                            frame_error.append(e)
+                        # convert to MII, same nibble on both edges
+                        frame_data, frame_error = _gmii_to_mii(frame.data, frame.error)
+                        frame_data_lo = frame_data_hi = frame_data
                     else:
+                        # split into nibbles for DDR transfer
                         frame_data = frame.data
                         frame_error = frame.error
+                        frame_data_lo = frame_data.translate(_NIBBLE_LO)
+                        frame_data_hi = frame_data.translate(_NIBBLE_HI)
+
+                    frame_ctrl_hi = frame_error.translate(_CTRL_ER)
+
+                    frame_iter = zip(frame_data, frame_data_lo, frame_data_hi, frame_ctrl_hi)
 
                     self.active = True
                     frame_offset = 0
+                    frame_len = len(frame_data)
 
                 if frame is not None:
-                    d = frame_data[frame_offset]
-                    er = frame_error[frame_offset]
+                    d, d_lo, d_hi, ctrl_hi = next(frame_iter)
                     en = 1
                     frame_offset += 1
 
-                    if frame.sim_time_sfd is None and d in (EthPre.SFD, 0xD, 0xDD):
+                    if frame.sim_time_sfd is None and _IS_SFD[d]:
                         frame.sim_time_sfd = get_sim_time()
 
-                    if frame_offset >= len(frame_data):
+                    if frame_offset >= frame_len:
                         ifg_cnt = max(self.ifg, 1)
                         in_ifg = True
                         frame.sim_time_end = get_sim_time()
                         frame.handle_tx_complete()
                         frame = None
+                        frame_iter = None
                         self.current_frame = None
                 else:
-                    d = 0
-                    er = 0
+                    d_lo = 0
+                    d_hi = 0
                     en = 0
+                    ctrl_hi = 0
                     self.active = False
 
                     if not in_ifg and self.queue.empty():
@@ -259,7 +277,7 @@ class RgmiiSource(Reset):
                         self.active_event.clear()
                         await self.active_event.wait()
 
-            elif self.enable is not None and not self.enable.value:
+            else:
                 await enable_event
 
 
@@ -363,34 +381,38 @@ class RgmiiSink(Reset):
         dv_val = 0
         er_val = 0
 
+        data = self.data
+        ctrl = self.ctrl
+        enable = self.enable
+
         clock_rising_edge_event = RisingEdge(self.clock)
         clock_falling_edge_event = FallingEdge(self.clock)
 
-        active_event = RisingEdge(self.ctrl)
+        active_event = RisingEdge(ctrl)
 
         enable_event = None
-        if self.enable is not None:
-            enable_event = RisingEdge(self.enable)
+        if enable is not None:
+            enable_event = RisingEdge(enable)
 
         while True:
             await clock_rising_edge_event
 
-            if self.enable is None or self.enable.value:
+            if enable is None or enable.value:
 
                 # capture low nibble on rising edge
-                d_val = self.data.value.integer
-                dv_val = self.ctrl.value.integer
+                d_val = data.value.integer
+                dv_val = ctrl.value.integer
 
                 await clock_falling_edge_event
 
                 # capture high nibble on falling edge
-                d_val |= self.data.value.integer << 4
-                er_val = dv_val ^ self.ctrl.value.integer
+                d_val |= data.value.integer << 4
+                er_val = dv_val ^ ctrl.value.integer
 
                 if frame is None:
                     if dv_val:
                         # start of frame
-                        frame = GmiiFrame(bytearray(), [])
+                        frame = GmiiFrame(bytearray(), bytearray())
                         frame.sim_time_start = get_sim_time()
                 else:
                     if not dv_val:
@@ -400,25 +422,7 @@ class RgmiiSink(Reset):
                             self.mii_mode = bool(self.mii_select.value.integer)
 
                         if self.mii_mode:
-                            odd = True
-                            sync = False
-                            b = 0
-                            be = 0
-                            data = bytearray()
-                            error = []
-                            for n, e in zip(frame.data, frame.error):
-                                odd = not odd
-                                b = (n & 0x0F) << 4 | b >> 4
-                                be |= e
-                                if not sync and b == EthPre.SFD:
-                                    odd = True
-                                    sync = True
-                                if odd:
-                                    data.append(b)
-                                    error.append(be)
-                                    be = 0
-                            frame.data = data
-                            frame.error = error
+                            frame.data, frame.error = _mii_to_gmii(frame.data, frame.error)
 
                         frame.compact()
                         frame.sim_time_end = get_sim_time()
@@ -433,7 +437,7 @@ class RgmiiSink(Reset):
                         frame = None
 
                 if frame is not None:
-                    if frame.sim_time_sfd is None and d_val in (EthPre.SFD, 0xD, 0xDD):
+                    if frame.sim_time_sfd is None and _IS_SFD[d_val]:
                         frame.sim_time_sfd = get_sim_time()
 
                     frame.data.append(d_val)
@@ -442,7 +446,7 @@ class RgmiiSink(Reset):
                 if not dv_val:
                     await active_event
 
-            elif self.enable is not None and not self.enable.value:
+            else:
                 await enable_event
 
 
@@ -473,20 +477,12 @@ class RgmiiPhy:
             self._clock_cr.kill()
 
         if self.speed == 1000e6:
-            self._clock_cr = cocotb.start_soon(self._run_clock(8*1e9/self.speed))
+            period = 8*1e9/self.speed
             self.tx.mii_mode = False
             self.rx.mii_mode = False
         else:
-            self._clock_cr = cocotb.start_soon(self._run_clock(4*1e9/self.speed))
+            period = 4*1e9/self.speed
             self.tx.mii_mode = True
             self.rx.mii_mode = True
 
-    async def _run_clock(self, period):
-        half_period = get_sim_steps(period / 2.0, 'ns')
-        t = Timer(half_period)
-
-        while True:
-            await t
-            self.rx_clk.value = 1
-            await t
-            self.rx_clk.value = 0
+        self._clock_cr = cocotb.start_soon(Clock(self.rx_clk, period, units='ns').start(start_high=False))
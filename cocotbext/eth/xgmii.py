@@ -36,6 +36,10 @@ from .constants import EthPre, ETH_PREAMBLE, XgmiiCtrl
 from .reset import Reset
 
 
+# maps control flags to ASCII binary digits
+_CTRL_BITS = bytes.maketrans(b'\x00\x01', b'01')
+
+
 class XgmiiFrame:
     def __init__(self, data=None, ctrl=None, tx_complete=None):
         self.data = bytearray()
@@ -48,7 +52,8 @@ class XgmiiFrame:
 
         if type(data) is XgmiiFrame:
             self.data = bytearray(data.data)
-            self.ctrl = data.ctrl
+            if data.ctrl is not None:
+                self.ctrl = bytearray(data.ctrl)
             self.sim_time_start = data.sim_time_start
             self.sim_time_sfd = data.sim_time_sfd
             self.sim_time_end = data.sim_time_end
@@ -56,7 +61,8 @@ class XgmiiFrame:
             self.tx_complete = data.tx_complete
         else:
             self.data = bytearray(data)
-            self.ctrl = ctrl
+            if ctrl is not None:
+                self.ctrl = bytearray(ctrl)
 
         if tx_complete is not None:
             self.tx_complete = tx_complete
@@ -65,7 +71,7 @@ class XgmiiFrame:
     def from_payload(cls, payload, min_len=60, tx_complete=None):
         payload = bytearray(payload)
         if len(payload) < min_len:
-            payload.extend(bytearray(min_len-len(payload)))
+            payload.extend(bytes(min_len-len(payload)))
         payload.extend(struct.pack('<L', zlib.crc32(payload)))
         return cls.from_raw_payload(payload, tx_complete=tx_complete)
 
@@ -91,18 +97,20 @@ class XgmiiFrame:
         return self.data[-4:]
 
     def check_fcs(self):
-        return self.get_fcs() == struct.pack('<L', zlib.crc32(self.get_payload(strip_fcs=True)))
+        return int.from_bytes(self.get_fcs(), 'little') == zlib.crc32(self.get_payload(strip_fcs=True))
 
     def normalize(self):
         n = len(self.data)
 
         if self.ctrl is not None:
-            self.ctrl = self.ctrl[:n] + [self.ctrl[-1]]*(n-len(self.ctrl))
+            self.ctrl = bytearray(self.ctrl[:n])
+            if len(self.ctrl) < n:
+                self.ctrl.extend(bytearray([self.ctrl[-1]])*(n-len(self.ctrl)))
         else:
-            self.ctrl = [0]*n
+            self.ctrl = bytearray(n)
 
     def compact(self):
-        if self.ctrl is not None and not any(self.ctrl):
+        if self.ctrl is not None and self.ctrl.count(0) == len(self.ctrl):
             self.ctrl = None
 
     def handle_tx_complete(self):
@@ -272,21 +280,30 @@ class XgmiiSource(Reset):
 
     async def _run(self):
         frame = None
+        frame_words = []
+        frame_len = 0
         frame_offset = 0
+        frame_sfd = -1
+        frame_ifg = 0
+        idle_written = False
         ifg_cnt = 0
         deficit_idle_cnt = 0
         self.active = False
 
+        data = self.data
+        ctrl = self.ctrl
+        enable = self.enable
+
         clock_edge_event = RisingEdge(self.clock)
 
         enable_event = None
-        if self.enable is not None:
-            enable_event = RisingEdge(self.enable)
+        if enable is not None:
+            enable_event = RisingEdge(enable)
 
         while True:
             await clock_edge_event
 
-            if self.enable is None or self.enable.value:
+            if enable is None or enable.value:
                 if ifg_cnt + deficit_idle_cnt > self.byte_lanes-1 or (not self.enable_dic and ifg_cnt > 4):
                     # in IFG
                     ifg_cnt = ifg_cnt - self.byte_lanes
@@ -326,13 +343,33 @@ class XgmiiSource(Reset):
                         if self.byte_lanes > 4 and (ifg_cnt > min_ifg or self.force_offset_start):
                             ifg_cnt = ifg_cnt-4
                             frame.start_lane = 4
-                            frame.data = bytearray([XgmiiCtrl.IDLE]*4)+frame.data
-                            frame.ctrl = [1]*4+frame.ctrl
+                            frame.data[0:0] = bytes([XgmiiCtrl.IDLE]*4)
+                            frame.ctrl[0:0] = bytes([1]*4)
 
                         if self.enable_dic:
                             deficit_idle_cnt = max(deficit_idle_cnt+ifg_cnt, 0)
                         ifg_cnt = 0
                         self.active = True
+
+                        # pack control flags into an integer, lane 0 in the LSB
+                        frame_ctrl = int(frame.ctrl[::-1].translate(_CTRL_BITS), 2)
+
+                        # pack frame into bus words
+                        frame_words = []
+                        for offset in range(0, len(frame.data), self.byte_lanes):
+                            frame_words.append((int.from_bytes(frame.data[offset:offset+self.byte_lanes], 'little'),
+                                (frame_ctrl >> offset) & self.idle_c))
+
+                        # fill remaining lanes with idle
+                        k = len(frame.data) - (len(frame_words)-1)*self.byte_lanes
+                        d_val, c_val = frame_words[-1]
+                        frame_words[-1] = (d_val | self.idle_d >> k*8 << k*8, c_val | self.idle_c >> k << k)
+                        frame_ifg = max(self.ifg - (self.byte_lanes-k+1), 0)
+
+                        frame_sfd = frame.data.find(EthPre.SFD)
+                        if frame_sfd >= 0:
+                            frame_sfd //= self.byte_lanes
+                        frame_len = len(frame_words)
                         frame_offset = 0
                     else:
                         # clear counters
@@ -340,33 +377,28 @@ class XgmiiSource(Reset):
                         ifg_cnt = 0
 
                 if frame is not None:
-                    d_val = 0
-                    c_val = 0
-
-                    for k in range(self.byte_lanes):
-                        if frame is not None:
-                            d = frame.data[frame_offset]
-                            if frame.sim_time_sfd is None and d == EthPre.SFD:
-                                frame.sim_time_sfd = get_sim_time()
-                            d_val |= d << k*8
-                            c_val |= frame.ctrl[frame_offset] << k
-                            frame_offset += 1
-
-                            if frame_offset >= len(frame.data):
-                                ifg_cnt = max(self.ifg - (self.byte_lanes-k), 0)
-                                frame.sim_time_end = get_sim_time()
-                                frame.handle_tx_complete()
-                                frame = None
-                                self.current_frame = None
-                        else:
-                            d_val |= XgmiiCtrl.IDLE << k*8
-                            c_val |= 1 << k
+                    d_val, c_val = frame_words[frame_offset]
+
+                    if frame_offset == frame_sfd:
+                        frame.sim_time_sfd = get_sim_time()
 
-                    self.data.value = d_val
-                    self.ctrl.value = c_val
+                    frame_offset += 1
+
+                    if frame_offset >= frame_len:
+                        ifg_cnt = frame_ifg
+                        frame.sim_time_end = get_sim_time()
+                        frame.handle_tx_complete()
+                        frame = None
+                        self.current_frame = None
+
+                    data.value = d_val
+                    ctrl.value = c_val
+                    idle_written = False
                 else:
-                    self.data.value = self.idle_d
-                    self.ctrl.value = self.idle_c
+                    if not idle_written:
+                        data.value = self.idle_d
+                        ctrl.value = self.idle_c
+                        idle_written = True
                     self.active = False
 
                     if ifg_cnt == 0 and self.queue.empty():
@@ -374,7 +406,7 @@ class XgmiiSource(Reset):
                         self.active_event.clear()
                         await self.active_event.wait()
 
-            elif self.enable is not None and not self.enable.value:
+            else:
                 await enable_event
 
 
@@ -412,6 +444,13 @@ class XgmiiSink(Reset):
         self.log.info("  Byte size: %d bits", self.byte_size)
         self.log.info("  Data width: %d bits (%d bytes)", self.width, self.byte_lanes)
 
+        self.idle_d = 0
+        self.idle_c = 0
+
+        for k in range(self.byte_lanes):
+            self.idle_d |= XgmiiCtrl.IDLE << k*8
+            self.idle_c |= 1 << k
+
         self._run_cr = None
 
         self._init_reset(reset, reset_active_level)
@@ -474,40 +513,58 @@ class XgmiiSink(Reset):
         frame = None
         self.active = False
 
+        data = self.data
+        ctrl = self.ctrl
+        enable = self.enable
+
         clock_edge_event = RisingEdge(self.clock)
 
-        active_event = First(Edge(self.data), Edge(self.ctrl))
+        active_event = First(Edge(data), Edge(ctrl))
 
         enable_event = None
-        if self.enable is not None:
-            enable_event = RisingEdge(self.enable)
-
-        idle_d = sum([XgmiiCtrl.IDLE << n*8 for n in range(self.byte_lanes)])
-        idle_c = 2**self.byte_lanes-1
+        if enable is not None:
+            enable_event = RisingEdge(enable)
 
         while True:
             await clock_edge_event
 
-            if self.enable is None or self.enable.value:
-                data_val = self.data.value.integer
-                ctrl_val = self.ctrl.value.integer
-                for offset in range(self.byte_lanes):
-                    d_val = (data_val >> (offset*8)) & 0xff
-                    c_val = (ctrl_val >> offset) & 1
+            if enable is None or enable.value:
+                data_val = data.value.integer
+                ctrl_val = ctrl.value.integer
+                data_bytes = data_val.to_bytes(self.byte_lanes, 'little')
+                offset = 0
 
+                while offset < self.byte_lanes:
                     if frame is None:
-                        if c_val and d_val == XgmiiCtrl.START:
+                        if (ctrl_val >> offset) & 1 and data_bytes[offset] == XgmiiCtrl.START:
                             # start
-                            frame = XgmiiFrame(bytearray([EthPre.PRE]), [0])
+                            frame = XgmiiFrame(bytearray([EthPre.PRE]), bytearray([0]))
                             frame.sim_time_start = get_sim_time()
                             frame.start_lane = offset
+                        offset += 1
                     else:
+                        # data lanes extend up to the next control character
+                        c_val = ctrl_val >> offset
                         if c_val:
+                            end = offset + (c_val & -c_val).bit_length() - 1
+                        else:
+                            end = self.byte_lanes
+
+                        chunk = data_bytes[offset:end]
+                        if frame.sim_time_sfd is None and EthPre.SFD in chunk:
+                            frame.sim_time_sfd = get_sim_time()
+
+                        frame.data.extend(chunk)
+                        frame.ctrl.extend(bytes(end-offset))
+                        offset = end
+
+                        if offset < self.byte_lanes:
                             # got a control character; terminate frame reception
+                            d_val = data_bytes[offset]
                             if d_val != XgmiiCtrl.TERM:
                                 # store control character if it's not a termination
                                 frame.data.append(d_val)
-                                frame.ctrl.append(c_val)
+                                frame.ctrl.append(1)
 
                             frame.compact()
                             frame.sim_time_end = get_sim_time()
@@ -520,15 +577,10 @@ class XgmiiSink(Reset):
                             self.active_event.set()
 
                             frame = None
-                        else:
-                            if frame.sim_time_sfd is None and d_val == EthPre.SFD:
-                                frame.sim_time_sfd = get_sim_time()
-
-                            frame.data.append(d_val)
-                            frame.ctrl.append(c_val)
+                            offset += 1
 
-                if data_val == idle_d and ctrl_val == idle_c:
+                if data_val == self.idle_d and ctrl_val == self.idle_c:
                     await active_event
 
-            elif self.enable is not None and not self.enable.value:
+            else:
                 await enable_event